@@ -181,6 +181,11 @@ CREATE INDEX IF NOT EXISTS idx_claims_carrier ON CLAIMS_TPA_FEE_WORKSHEET_SNAPSH
 CREATE INDEX IF NOT EXISTS idx_claims_snapshot_date ON CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT(SNAPSHOT_DATE);
 CREATE INDEX IF NOT EXISTS idx_claims_decision ON CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT(DECISION);
 
+-- Recommended for production volumes: every dashboard query filters on
+-- carrier + snapshot date, so clustering on them enables partition pruning
+-- ALTER TABLE POLICY_MONTHLY_SNAPSHOT_FACT CLUSTER BY (CARRIER_NAME, POLICY_SNAPSHOT_DATE);
+-- ALTER TABLE CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT CLUSTER BY (CARRIER_NAME, SNAPSHOT_DATE);
+
 -- Confirm tables created
 SELECT 'Tables created successfully' AS status;
 
@@ -0,0 +1,22 @@
+-- LTC Insurance Platform - View Creation Script
+-- Creates analytic views shared by the Streamlit in Snowflake dashboards
+
+USE DATABASE LTC_INSURANCE;
+USE SCHEMA ANALYTICS;
+
+-- ============================================================================
+-- V_CLAIMS_CORE View
+-- ============================================================================
+-- Claims rows that count toward TPA fee reporting: initial decisions,
+-- ongoing rate months and restorations. Baking the predicate into the view
+-- keeps the generated SQL text stable across dashboards and lets Snowflake
+-- prune micro-partitions before any per-page filters are applied.
+CREATE OR REPLACE VIEW V_CLAIMS_CORE AS
+SELECT *
+FROM CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT
+WHERE (ONGOING_RATE_MONTH = 1 AND IS_INITIAL_DECISION_FLAG IN (0, 1))
+   OR (ONGOING_RATE_MONTH = 0 AND IS_INITIAL_DECISION_FLAG = 1)
+   OR (ONGOING_RATE_MONTH = 2 AND IS_INITIAL_DECISION_FLAG IN (0, 1));
+
+-- Confirm views created
+SELECT 'Views created successfully' AS status;
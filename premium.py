@@ -5,17 +5,24 @@ Enterprise-grade Streamlit in Snowflake with extraordinary UX
 
 import streamlit as st
 from snowflake.snowpark.context import get_active_session
-from snowflake.snowpark.functions import (
-    col, sum as sum_, avg, count, lit, last_day, to_timestamp, 
-    when, count_distinct, max as max_, min as min_, datediff
-)
 from datetime import date, datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
 from typing import Optional, Dict, Any, List
+from string import Template
+import calendar
+import json
+import re
 import time
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; rules evaluate in plain Python without it
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 # ============================================================================
 # Configuration & Styling
 # ============================================================================
@@ -33,7 +40,7 @@ st.set_page_config(
 )
 
 # Custom CSS for premium look
-st.markdown("""
+PREMIUM_CSS = """
 <style>
     /* Premium color scheme */
     :root {
@@ -147,36 +154,54 @@ st.markdown("""
         animation: pulse 2s infinite;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def get_premium_css():
+    """Minify the premium stylesheet once per process."""
+    css = re.sub(r"/\*.*?\*/", "", PREMIUM_CSS, flags=re.DOTALL)
+    return re.sub(r"\s+", " ", css).strip()
+
+# Streamlit drops elements that are not re-emitted, so the (minified) CSS is sent every run
+st.markdown(get_premium_css(), unsafe_allow_html=True)
 
-# Get Snowpark session
-session = get_active_session()
+# st.fragment (Streamlit >= 1.37) shipped as st.experimental_fragment in 1.33-1.36
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@st.cache_resource
+def get_session():
+    """Resolve the Snowpark session once per process and share it across reruns."""
+    return get_active_session()
 
 # Constants
-CLAIMS_TABLE = "LTC_INSURANCE.ANALYTICS.CLAIMS_TPA_FEE_WORKSHEET_SNAPSHOT_FACT"
 POLICY_TABLE = "LTC_INSURANCE.ANALYTICS.POLICY_MONTHLY_SNAPSHOT_FACT"
+# Claims with the core business logic filter applied (sql_scripts/03_create_views.sql)
+CLAIMS_CORE_VIEW = "LTC_INSURANCE.ANALYTICS.V_CLAIMS_CORE"
 
 # Session state initialization
-if 'favorites' not in st.session_state:
-    st.session_state.favorites = []
-if 'comparison_mode' not in st.session_state:
-    st.session_state.comparison_mode = False
-if 'dark_mode' not in st.session_state:
-    st.session_state.dark_mode = False
+SESSION_DEFAULTS = {
+    'favorites': [], 'comparison_mode': False, 'dark_mode': False,
+    'auto_refresh': False, 'show_insights': True
+}
+for key, default in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, default)
 
 # ============================================================================
 # Premium Formatter Functions
 # ============================================================================
 
+# Precompiled formatters for the decimal settings used across the dashboards
+CURRENCY_FORMATS = {0: "${:,.0f}".format, 2: "${:,.2f}".format}
+NUMBER_FORMATS = {1: "{:,.1f}".format, 2: "{:,.2f}".format}
+
 def format_currency(value, decimals=2):
     """Format with currency symbol and color coding."""
     if value is None:
         return "N/A"
+    fmt = CURRENCY_FORMATS.get(decimals) or f"${{:,.{decimals}f}}".format
     try:
-        num = float(value)
-        formatted = f"${num:,.{decimals}f}"
-        return formatted
-    except:
+        return fmt(float(value))
+    except (TypeError, ValueError):
         return str(value)
 
 def format_number(value, decimals=0):
@@ -184,11 +209,11 @@ def format_number(value, decimals=0):
     if value is None:
         return "N/A"
     try:
-        num = float(value)
         if decimals == 0:
-            return f"{int(num):,}"
-        return f"{num:,.{decimals}f}"
-    except:
+            return f"{int(float(value)):,}"
+        fmt = NUMBER_FORMATS.get(decimals) or f"{{:,.{decimals}f}}".format
+        return fmt(float(value))
+    except (TypeError, ValueError):
         return str(value)
 
 def format_percentage(value, decimals=1):
@@ -197,10 +222,10 @@ def format_percentage(value, decimals=1):
         return "N/A"
     try:
         num = float(value)
-        emoji = "📈" if num > 0 else "📉" if num < 0 else "➡️"
-        return f"{emoji} {num:.{decimals}f}%"
-    except:
+    except (TypeError, ValueError):
         return str(value)
+    emoji = "📈" if num > 0 else "📉" if num < 0 else "➡️"
+    return f"{emoji} {num:.{decimals}f}%"
 
 def get_trend_indicator(current, previous):
     """Get trend indicator with arrow."""
@@ -218,298 +243,464 @@ def get_trend_indicator(current, previous):
 # Data Access with Smart Caching
 # ============================================================================
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_claims_summary(_session, carrier_name=None, report_end_dt=None):
-    """Get comprehensive claims summary with performance metrics."""
-    start_time = time.time()
-    
-    df = _session.table(CLAIMS_TABLE)
-    
-    # Core business logic filter
-    core_filter = (
-        ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-        ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-        ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
+# Hot-path aggregates as fixed SQL text with bind parameters. Byte-identical
+# statements skip Snowpark plan construction and reuse Snowflake's result cache.
+# The column lists below are the single source for the overview and executive
+# statements. Rates are derived in SQL too (DIV0 yields 0 for an empty slice),
+# so the returned row is already in its final shape.
+CLAIMS_SUMMARY_COLUMNS = """
+    COUNT(*) AS total_claims,
+    SUM(INITIAL_DECISIONS_FACILITIES) AS facility_claims,
+    SUM(INITIAL_DECISIONS_HOME_HEALTH) AS home_health_claims,
+    SUM(INITIAL_DECISIONS_ALL_OTHER) AS other_claims,
+    SUM(RETRO_ALL_FACILITIES + RETRO_HOME_HEALTH + RETRO_ALL_OTHER) AS total_retro_claims,
+    SUM(RETRO_ALL_FACILITIES) AS retro_facility_claims,
+    SUM(RETRO_HOME_HEALTH) AS retro_home_health_claims,
+    SUM(RETRO_ALL_OTHER) AS retro_other_claims,
+    AVG(RFB_PROCESS_TO_DECISION_TAT) AS avg_processing_time,
+    AVG(RETRO_MONTHS) AS avg_retro_months,
+    MAX(RFB_PROCESS_TO_DECISION_TAT) AS max_tat,
+    MIN(RFB_PROCESS_TO_DECISION_TAT) AS min_tat,
+    SUM(IFF(DECISION = 'Approved', 1, 0)) AS approved_claims,
+    SUM(IFF(DECISION = 'Denied', 1, 0)) AS denied_claims,
+    SUM(IFF(DECISION IN ('In Assessment', 'Pending'), 1, 0)) AS in_assessment_claims,
+    SUM(IFF(ONGOING_RATE_MONTH = 0, 1, 0)) AS initial_decisions,
+    SUM(IFF(ONGOING_RATE_MONTH = 1, 1, 0)) AS ongoing_decisions,
+    SUM(IFF(ONGOING_RATE_MONTH = 2, 1, 0)) AS restoration_decisions,
+    DIV0(SUM(IFF(DECISION = 'Approved', 1, 0)) * 100, COUNT(*)) AS approval_rate,
+    DIV0(SUM(RETRO_ALL_FACILITIES + RETRO_HOME_HEALTH + RETRO_ALL_OTHER) * 100, COUNT(*)) AS retro_percentage
+"""
+
+# Summary scalars plus the most recent claims from one scan of the filtered view
+CLAIMS_OVERVIEW_SQL = f"""
+WITH filtered AS (
+    SELECT
+        TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID, POLICY_NUMBER, CLAIMANTNAME, CARRIER_NAME,
+        DECISION, SNAPSHOT_DATE, ONGOING_RATE_MONTH, RFB_PROCESS_TO_DECISION_TAT,
+        INITIAL_DECISIONS_FACILITIES, INITIAL_DECISIONS_HOME_HEALTH, INITIAL_DECISIONS_ALL_OTHER,
+        RETRO_ALL_FACILITIES, RETRO_HOME_HEALTH, RETRO_ALL_OTHER, RETRO_MONTHS
+    FROM {CLAIMS_CORE_VIEW}
+    {{where}}
+),
+summary AS (
+    SELECT{CLAIMS_SUMMARY_COLUMNS}FROM filtered
+),
+recent AS (
+    SELECT
+        TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID AS "Claim_ID",
+        POLICY_NUMBER AS "Policy_Number",
+        CLAIMANTNAME AS "Claimant_Name",
+        CARRIER_NAME AS "Carrier",
+        DECISION AS "Decision",
+        SNAPSHOT_DATE AS "Snapshot_Date",
+        ONGOING_RATE_MONTH AS "Rate_Month",
+        RFB_PROCESS_TO_DECISION_TAT AS "TAT_Days"
+    FROM filtered
+    QUALIFY ROW_NUMBER() OVER (ORDER BY SNAPSHOT_DATE DESC) <= ?
+)
+SELECT
+    (SELECT OBJECT_CONSTRUCT_KEEP_NULL(*) FROM summary) AS summary,
+    ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*)) WITHIN GROUP (ORDER BY "Snapshot_Date" DESC) AS claims
+FROM recent
+"""
+
+CLAIMS_LIST_COLUMNS = [
+    "Claim_ID", "Policy_Number", "Claimant_Name", "Carrier",
+    "Decision", "Snapshot_Date", "Rate_Month", "TAT_Days"
+]
+
+POLICY_METRICS_COLUMNS = """
+    COUNT(*) AS total_policies,
+    AVG(RATED_AGE) AS avg_age,
+    SUM(ANNUALIZED_PREMIUM) AS total_premium,
+    AVG(ANNUALIZED_PREMIUM) AS avg_premium,
+    SUM(LIFETIME_COLLECTED_PREMIUM) AS total_collected,
+    SUM(TOTAL_ACTIVE_CLAIMS) AS total_active_claims,
+    SUM(TOTAL_RFBS) AS total_rfbs,
+    SUM(TOTAL_APPROVED_RFBS) AS total_approved_rfbs,
+    COUNT(DISTINCT INSURED_STATE) AS states_count,
+    SUM(IFF(IN_WAIVER_FLG = 'Yes', 1, 0)) AS in_waiver,
+    SUM(IFF(IN_NONFORFEITURE_FLG = 'Yes', 1, 0)) AS in_forfeiture,
+    SUM(IFF(UPPER(POLICY_STATUS_DIM_ID) = 'ACTIVE', 1, 0)) AS active_policies,
+    SUM(IFF(TOTAL_ACTIVE_CLAIMS > 0, 1, 0)) AS policies_with_claims,
+    DIV0((COUNT(*) - SUM(IFF(UPPER(POLICY_STATUS_DIM_ID) = 'ACTIVE', 1, 0))) * 100, COUNT(*)) AS lapse_rate,
+    DIV0(SUM(TOTAL_ACTIVE_CLAIMS), COUNT(*)) AS avg_claims_per_policy
+"""
+
+# Policy metrics, top states and top policies from one scan of the filtered slice
+POLICY_OVERVIEW_SQL = f"""
+WITH filtered AS (
+    SELECT
+        POLICY_ID, CARRIER_NAME, INSURED_STATE, POLICY_STATUS_DIM_ID, ANNUALIZED_PREMIUM,
+        LIFETIME_COLLECTED_PREMIUM, RATED_AGE, IN_WAIVER_FLG, IN_NONFORFEITURE_FLG,
+        TOTAL_ACTIVE_CLAIMS, TOTAL_RFBS, TOTAL_APPROVED_RFBS
+    FROM {POLICY_TABLE}
+    {{where}}
+),
+metrics AS (
+    SELECT{POLICY_METRICS_COLUMNS}FROM filtered
+),
+states AS (
+    SELECT
+        INSURED_STATE,
+        COUNT(*) AS policy_count,
+        SUM(ANNUALIZED_PREMIUM) AS total_premium
+    FROM filtered
+    GROUP BY INSURED_STATE
+),
+states_by_count AS (
+    SELECT * FROM states
+    QUALIFY ROW_NUMBER() OVER (ORDER BY policy_count DESC) <= ?
+),
+states_by_premium AS (
+    SELECT * FROM states
+    QUALIFY ROW_NUMBER() OVER (ORDER BY total_premium DESC NULLS LAST) <= ?
+),
+top_policies AS (
+    SELECT
+        POLICY_ID AS "Policy_ID",
+        CARRIER_NAME AS "Carrier",
+        INSURED_STATE AS "State",
+        POLICY_STATUS_DIM_ID AS "Status",
+        ANNUALIZED_PREMIUM AS "Annual_Premium",
+        RATED_AGE AS "Age",
+        IN_WAIVER_FLG AS "In_Waiver",
+        TOTAL_ACTIVE_CLAIMS AS "Active_Claims"
+    FROM filtered
+    QUALIFY ROW_NUMBER() OVER (ORDER BY ANNUALIZED_PREMIUM DESC NULLS LAST) <= ?
+)
+SELECT
+    (SELECT OBJECT_CONSTRUCT_KEEP_NULL(*) FROM metrics) AS metrics,
+    (SELECT ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*)) WITHIN GROUP (ORDER BY policy_count DESC) FROM states_by_count) AS states_by_count,
+    -- Ascending so the horizontal bar chart draws the largest state on top
+    (SELECT ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*)) WITHIN GROUP (ORDER BY total_premium ASC) FROM states_by_premium) AS states_by_premium,
+    (SELECT ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*)) WITHIN GROUP (ORDER BY "Annual_Premium" DESC NULLS LAST) FROM top_policies) AS policies
+"""
+
+STATE_DISTRIBUTION_COLUMNS = ["INSURED_STATE", "POLICY_COUNT", "TOTAL_PREMIUM"]
+
+POLICY_LIST_COLUMNS = [
+    "Policy_ID", "Carrier", "State", "Status",
+    "Annual_Premium", "Age", "In_Waiver", "Active_Claims"
+]
+
+# Both executive-page aggregates in one statement: one compile, one round trip
+EXECUTIVE_KPIS_SQL = f"""
+WITH claims_agg AS (
+    SELECT{CLAIMS_SUMMARY_COLUMNS}FROM {CLAIMS_CORE_VIEW}
+    {{claims_where}}
+),
+policy_agg AS (
+    SELECT{POLICY_METRICS_COLUMNS}FROM {POLICY_TABLE}
+    {{policy_where}}
+)
+SELECT
+    (SELECT OBJECT_CONSTRUCT_KEEP_NULL(*) FROM claims_agg) AS claims,
+    (SELECT OBJECT_CONSTRUCT_KEEP_NULL(*) FROM policy_agg) AS policy
+"""
+
+def bind_filters(*filters):
+    """Render ``(column, value)`` equality filters as a WHERE clause plus bind params.
+    
+    Filters with an empty value are skipped, so optional carrier/date filters
+    can be passed through as-is.
+    """
+    active = [(column, value) for column, value in filters if value]
+    if not active:
+        return "", []
+    clause = "WHERE " + " AND ".join(f"{column} = ?" for column, _ in active)
+    return clause, [value for _, value in active]
+
+def month_end(day):
+    """Return the last calendar day of the month containing ``day``."""
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+def claims_filters(carrier_name=None, report_end_dt=None):
+    """Return the ``(column, value)`` carrier/date filters for the claims view.
+    
+    Claims snapshots are month-end DATEs, so any day in the month selects them.
+    """
+    return (
+        ("CARRIER_NAME", carrier_name),
+        ("SNAPSHOT_DATE", month_end(report_end_dt) if report_end_dt else None)
     )
-    df = df.filter(core_filter)
-    
-    if carrier_name:
-        df = df.filter(col("CARRIER_NAME") == carrier_name)
-    
-    if report_end_dt:
-        date_str = report_end_dt.strftime('%Y-%m-%d')
-        df = df.filter(col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str))))
-    
-    # Aggregate metrics
-    result = df.agg([
-        count("*").alias("total_claims"),
-        sum_(col("INITIAL_DECISIONS_FACILITIES")).alias("facility_claims"),
-        sum_(col("INITIAL_DECISIONS_HOME_HEALTH")).alias("home_health_claims"),
-        sum_(col("INITIAL_DECISIONS_ALL_OTHER")).alias("other_claims"),
-        sum_(col("RETRO_ALL_FACILITIES") + col("RETRO_HOME_HEALTH") + col("RETRO_ALL_OTHER")).alias("total_retro_claims"),
-        avg(col("RFB_PROCESS_TO_DECISION_TAT")).alias("avg_processing_time"),
-        avg(col("RETRO_MONTHS")).alias("avg_retro_months"),
-        max_(col("RFB_PROCESS_TO_DECISION_TAT")).alias("max_tat"),
-        min_(col("RFB_PROCESS_TO_DECISION_TAT")).alias("min_tat")
-    ]).collect()[0]
-    
-    summary = {k.lower(): float(v) if v is not None else 0.0 for k, v in result.as_dict().items()}
-    
-    # Decision counts
-    approved = df.filter(col("DECISION") == "Approved").count()
-    denied = df.filter(col("DECISION") == "Denied").count()
-    in_assessment = df.filter(col("DECISION").isin(["In Assessment", "Pending"])).count()
-    
-    summary["approved_claims"] = float(approved)
-    summary["denied_claims"] = float(denied)
-    summary["in_assessment_claims"] = float(in_assessment)
-    summary["approval_rate"] = (approved / summary.get("total_claims", 1) * 100) if summary.get("total_claims") > 0 else 0.0
-    
-    # Retro metrics
-    total = summary.get("total_claims", 1)
-    summary["retro_percentage"] = (summary.get("total_retro_claims", 0) / total * 100) if total > 0 else 0.0
-    
-    # Ongoing rate counts
-    initial = df.filter(col("ONGOING_RATE_MONTH") == 0).count()
-    ongoing = df.filter(col("ONGOING_RATE_MONTH") == 1).count()
-    restoration = df.filter(col("ONGOING_RATE_MONTH") == 2).count()
-    
-    summary["initial_decisions"] = float(initial)
-    summary["ongoing_decisions"] = float(ongoing)
-    summary["restoration_decisions"] = float(restoration)
-    
-    # Performance metric
-    summary["query_time"] = time.time() - start_time
-    
-    return summary
-
-@st.cache_data(ttl=300, show_spinner=False)
-def get_claims_list(_session, carrier_name=None, report_end_dt=None, limit=100):
-    """Get detailed claims list."""
-    df = _session.table(CLAIMS_TABLE)
-    
-    core_filter = (
-        ((col("ONGOING_RATE_MONTH") == 1) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1])) |
-        ((col("ONGOING_RATE_MONTH") == 0) & (col("IS_INITIAL_DECISION_FLAG") == 1)) |
-        ((col("ONGOING_RATE_MONTH") == 2) & col("IS_INITIAL_DECISION_FLAG").isin([0, 1]))
+
+def policy_filters(carrier_name=None, snapshot_date=None):
+    """Return the ``(column, value)`` carrier/date filters for the policy table.
+    
+    POLICY_SNAPSHOT_DATE is stored as 'YYYY-MM-DD' text, so the date is compared
+    as its ISO string rather than cast per row.
+    """
+    return (
+        ("CARRIER_NAME", carrier_name),
+        ("POLICY_SNAPSHOT_DATE", snapshot_date.isoformat() if snapshot_date else None)
     )
-    df = df.filter(core_filter)
-    
-    if carrier_name:
-        df = df.filter(col("CARRIER_NAME") == carrier_name)
-    
-    if report_end_dt:
-        date_str = report_end_dt.strftime('%Y-%m-%d')
-        df = df.filter(col("SNAPSHOT_DATE") == last_day(to_timestamp(lit(date_str))))
-    
-    df = df.select(
-        col("TPA_FEE_WORKSHEET_SNAPSHOT_FACT_ID").alias("Claim_ID"),
-        col("POLICY_NUMBER").alias("Policy_Number"),
-        col("CLAIMANTNAME").alias("Claimant_Name"),
-        col("CARRIER_NAME").alias("Carrier"),
-        col("DECISION").alias("Decision"),
-        col("SNAPSHOT_DATE").alias("Snapshot_Date"),
-        col("ONGOING_RATE_MONTH").alias("Rate_Month"),
-        col("RFB_PROCESS_TO_DECISION_TAT").alias("TAT_Days")
-    ).order_by(col("SNAPSHOT_DATE").desc()).limit(limit)
-    
-    return df.to_pandas()
-
-@st.cache_data(ttl=300, show_spinner=False)
-def get_policy_metrics(_session, carrier_name=None, snapshot_date=None):
-    """Get comprehensive policy metrics."""
-    start_time = time.time()
-    
-    df = _session.table(POLICY_TABLE)
-    
-    if carrier_name:
-        df = df.filter(col("CARRIER_NAME") == carrier_name)
-    
-    if snapshot_date:
-        date_str = snapshot_date.strftime('%Y-%m-%d')
-        df = df.filter(col("POLICY_SNAPSHOT_DATE") == date_str)
-    
-    result = df.agg([
-        count("*").alias("total_policies"),
-        avg(col("RATED_AGE")).alias("avg_age"),
-        sum_(col("ANNUALIZED_PREMIUM")).alias("total_premium"),
-        avg(col("ANNUALIZED_PREMIUM")).alias("avg_premium"),
-        sum_(col("LIFETIME_COLLECTED_PREMIUM")).alias("total_collected"),
-        sum_(col("TOTAL_ACTIVE_CLAIMS")).alias("total_active_claims"),
-        sum_(col("TOTAL_RFBS")).alias("total_rfbs"),
-        sum_(col("TOTAL_APPROVED_RFBS")).alias("total_approved_rfbs"),
-        count_distinct(col("INSURED_STATE")).alias("states_count")
-    ]).collect()[0]
-    
-    metrics = {k.lower(): float(v) if v is not None else 0.0 for k, v in result.as_dict().items()}
-    
-    # Status counts
-    in_waiver = df.filter(col("IN_WAIVER_FLG") == "Yes").count()
-    in_forfeiture = df.filter(col("IN_NONFORFEITURE_FLG") == "Yes").count()
-    active_policies = df.filter(col("POLICY_STATUS_DIM_ID").isin(["ACTIVE", "Active"])).count()
-    
-    metrics["in_waiver"] = float(in_waiver)
-    metrics["in_forfeiture"] = float(in_forfeiture)
-    metrics["active_policies"] = float(active_policies)
-    
-    total = metrics.get("total_policies", 1)
-    metrics["lapse_rate"] = ((total - active_policies) / total * 100) if total > 0 else 0.0
-    metrics["policies_with_claims"] = float(df.filter(col("TOTAL_ACTIVE_CLAIMS") > 0).count())
-    metrics["avg_claims_per_policy"] = metrics.get("total_active_claims", 0) / total if total > 0 else 0.0
-    
-    # Performance metric
-    metrics["query_time"] = time.time() - start_time
-    
-    return metrics
-
-@st.cache_data(ttl=300, show_spinner=False)
-def get_state_distribution(_session, carrier_name=None, snapshot_date=None, top_n=10):
-    """Get geographic distribution."""
-    df = _session.table(POLICY_TABLE)
-    
-    if carrier_name:
-        df = df.filter(col("CARRIER_NAME") == carrier_name)
-    
-    if snapshot_date:
-        date_str = snapshot_date.strftime('%Y-%m-%d')
-        df = df.filter(col("POLICY_SNAPSHOT_DATE") == date_str)
-    
-    result = df.group_by("INSURED_STATE").agg([
-        count("*").alias("policy_count"),
-        sum_(col("ANNUALIZED_PREMIUM")).alias("total_premium")
-    ]).order_by(col("policy_count").desc()).limit(top_n).to_pandas()
-    
+
+# Closed months never change, so their results live for a day; the current
+# month is still loading and rolls over every LIVE_TTL seconds instead.
+HISTORICAL_TTL = 86400
+LIVE_TTL = 300
+
+def cache_freshness(day):
+    """Return the ``freshness`` cache-key component for a snapshot date.
+    
+    st.cache_data has one TTL per function, so the accessors use the long
+    HISTORICAL_TTL and take this value as an extra key: 0 for closed months,
+    a LIVE_TTL time bucket for the current month so its entries turn over.
+    """
+    today = date.today()
+    if day and (day.year, day.month) < (today.year, today.month):
+        return 0
+    return int(time.time() // LIVE_TTL)
+
+def to_scalars(row):
+    """Normalize an aggregate row (pandas Series) to floats keyed by lowercase name."""
+    return row.fillna(0.0).astype(float).rename(str.lower).to_dict()
+
+def reuse_page_data(page, key, load):
+    """Return this viewer's last result for ``page`` if its filter key is unchanged.
+    
+    st.cache_data hashes the arguments and unpickles a fresh copy on every
+    hit; a rerun that only flips a tab or checkbox skips both by reusing the
+    objects kept in session state. Results must be treated as read-only.
+    """
+    page_data = st.session_state.setdefault("page_data", {})
+    cached = page_data.get(page)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    result = load()
+    page_data[page] = (key, result)
     return result
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_policy_list(_session, carrier_name=None, snapshot_date=None, limit=100):
-    """Get detailed policy list."""
-    df = _session.table(POLICY_TABLE)
-    
-    if carrier_name:
-        df = df.filter(col("CARRIER_NAME") == carrier_name)
+@st.cache_data(ttl=HISTORICAL_TTL, max_entries=128, show_spinner=False)
+def get_claims_overview(carrier_name=None, report_end_dt=None, limit=100, freshness=0):
+    """Get the claims summary and most recent claims list in a single query."""
+    where, params = bind_filters(*claims_filters(carrier_name, report_end_dt))
+    row = get_session().sql(CLAIMS_OVERVIEW_SQL.format(where=where), params=params + [limit]).collect()[0]
     
-    if snapshot_date:
-        date_str = snapshot_date.strftime('%Y-%m-%d')
-        df = df.filter(col("POLICY_SNAPSHOT_DATE") == date_str)
+    summary = to_scalars(pd.Series(json.loads(row["SUMMARY"])))
+    claims_df = pd.DataFrame(json.loads(row["CLAIMS"] or "[]"), columns=CLAIMS_LIST_COLUMNS)
+    claims_df["Snapshot_Date"] = pd.to_datetime(claims_df["Snapshot_Date"]).dt.date
     
-    df = df.select(
-        col("POLICY_ID").alias("Policy_ID"),
-        col("CARRIER_NAME").alias("Carrier"),
-        col("INSURED_STATE").alias("State"),
-        col("POLICY_STATUS_DIM_ID").alias("Status"),
-        col("ANNUALIZED_PREMIUM").alias("Annual_Premium"),
-        col("RATED_AGE").alias("Age"),
-        col("IN_WAIVER_FLG").alias("In_Waiver"),
-        col("TOTAL_ACTIVE_CLAIMS").alias("Active_Claims")
-    ).order_by(col("ANNUALIZED_PREMIUM").desc()).limit(limit)
+    return summary, claims_df
+
+@st.cache_data(ttl=HISTORICAL_TTL, max_entries=128, show_spinner=False)
+def get_claims_csv(carrier_name=None, report_end_dt=None, limit=100, freshness=0):
+    """Get the recent-claims export as CSV bytes, serialized once per filter set."""
+    _, claims_df = get_claims_overview(carrier_name, report_end_dt, limit, freshness)
+    return claims_df.to_csv(index=False).encode()
+
+@st.cache_data(ttl=HISTORICAL_TTL, max_entries=128, show_spinner=False)
+def get_policy_overview(carrier_name=None, snapshot_date=None, top_n=10, limit=100, freshness=0):
+    """Get policy metrics, the top states (by count and by premium) and the top policies in a single query."""
+    where, params = bind_filters(*policy_filters(carrier_name, snapshot_date))
+    row = get_session().sql(
+        POLICY_OVERVIEW_SQL.format(where=where), params=params + [top_n, top_n, limit]
+    ).collect()[0]
+    
+    metrics = to_scalars(pd.Series(json.loads(row["METRICS"])))
+    states_by_count, states_by_premium = (
+        pd.DataFrame(json.loads(row[name] or "[]"), columns=STATE_DISTRIBUTION_COLUMNS)
+        for name in ("STATES_BY_COUNT", "STATES_BY_PREMIUM")
+    )
+    policy_df = pd.DataFrame(json.loads(row["POLICIES"] or "[]"), columns=POLICY_LIST_COLUMNS)
     
-    return df.to_pandas()
+    return metrics, states_by_count, states_by_premium, policy_df
+
+@st.cache_data(ttl=HISTORICAL_TTL, max_entries=128, show_spinner=False)
+def get_policy_csv(carrier_name=None, snapshot_date=None, top_n=10, limit=100, freshness=0):
+    """Get the top-policies export as CSV bytes, serialized once per filter set."""
+    *_, policy_df = get_policy_overview(carrier_name, snapshot_date, top_n, limit, freshness)
+    return policy_df.to_csv(index=False).encode()
+
+@st.cache_data(ttl=HISTORICAL_TTL, max_entries=128, show_spinner=False)
+def get_executive_kpis(carrier_name=None, snapshot_date=None, freshness=0):
+    """Get the claims summary and policy metrics in a single query."""
+    claims_where, claims_params = bind_filters(*claims_filters(carrier_name, snapshot_date))
+    policy_where, policy_params = bind_filters(*policy_filters(carrier_name, snapshot_date))
+    sql = EXECUTIVE_KPIS_SQL.format(claims_where=claims_where, policy_where=policy_where)
+    row = get_session().sql(sql, params=claims_params + policy_params).collect()[0]
+    
+    return to_scalars(pd.Series(json.loads(row["CLAIMS"]))), to_scalars(pd.Series(json.loads(row["POLICY"])))
 
 # ============================================================================
 # AI-Powered Insights Generator
 # ============================================================================
 
+# Insight rules per data type: (metric, op, threshold, title, message).
+# Messages are formatted with the metric vector, so new rules are data, not code.
+INSIGHT_RULES = {
+    "claims": (
+        ("approval_rate", ">", 80, "🎯 **Excellent Performance**",
+         "Approval rate of {approval_rate:.1f}% exceeds industry benchmark of 75%"),
+        ("approval_rate", "<", 60, "⚠️ **Action Required**",
+         "Approval rate of {approval_rate:.1f}% is below target. Review denial reasons."),
+        ("avg_processing_time", "<", 25, "⚡ **Fast Processing**",
+         "Average TAT of {avg_processing_time:.1f} days is {tat_headroom:.1f} days faster than target"),
+        ("avg_processing_time", ">", 35, "🐌 **Slow Processing**",
+         "Average TAT of {avg_processing_time:.1f} days exceeds 30-day target. Consider staffing review."),
+        ("total_claims", ">", 100, "📊 **High Volume Period**",
+         "Processing {total_claims} claims. Monitor capacity closely."),
+    ),
+    "policy": (
+        ("lapse_rate", "<", 5, "✨ **Strong Retention**",
+         "Lapse rate of {lapse_rate:.1f}% indicates excellent policy retention"),
+        ("lapse_rate", ">", 10, "⚠️ **Retention Risk**",
+         "Lapse rate of {lapse_rate:.1f}% requires attention. Review customer satisfaction."),
+        ("avg_premium_per_policy", ">", 4000, "💰 **Premium Portfolio**",
+         "Average premium of ${avg_premium_per_policy:,.0f} indicates high-value policies"),
+    ),
+}
+
+# Packed operator codes (1 = greater than, 0 = less than) and thresholds
+INSIGHT_RULE_ARRAYS = {
+    data_type: (
+        np.array([1 if op == ">" else 0 for _, op, _, _, _ in rules], dtype=np.int8),
+        np.array([threshold for _, _, threshold, _, _ in rules], dtype=np.float64)
+    )
+    for data_type, rules in INSIGHT_RULES.items()
+}
+
+@st.cache_resource
+def get_rule_evaluator():
+    """Build the rule kernel once per process (JIT-compiled when numba is available)."""
+    @njit
+    def evaluate_rules(values, ops, thresholds):
+        fired = np.empty(values.shape[0], dtype=np.bool_)
+        for i in range(values.shape[0]):
+            if ops[i] == 1:
+                fired[i] = values[i] > thresholds[i]
+            else:
+                fired[i] = values[i] < thresholds[i]
+        return fired
+    return evaluate_rules
+
 def generate_smart_insights(summary_data, data_type="claims"):
     """Generate AI-like insights from data."""
-    insights = []
+    rule_set = "claims" if data_type == "claims" else "policy"
+    rules = INSIGHT_RULES[rule_set]
+    ops, thresholds = INSIGHT_RULE_ARRAYS[rule_set]
     
     if data_type == "claims":
-        total = summary_data.get("total_claims", 0)
-        approval_rate = summary_data.get("approval_rate", 0)
         avg_tat = summary_data.get("avg_processing_time", 0)
-        
-        # Approval rate insights
-        if approval_rate > 80:
-            insights.append(("🎯 **Excellent Performance**", 
-                           f"Approval rate of {approval_rate:.1f}% exceeds industry benchmark of 75%"))
-        elif approval_rate < 60:
-            insights.append(("⚠️ **Action Required**", 
-                           f"Approval rate of {approval_rate:.1f}% is below target. Review denial reasons."))
-        
-        # TAT insights
-        if avg_tat < 25:
-            insights.append(("⚡ **Fast Processing**", 
-                           f"Average TAT of {avg_tat:.1f} days is {25-avg_tat:.1f} days faster than target"))
-        elif avg_tat > 35:
-            insights.append(("🐌 **Slow Processing**", 
-                           f"Average TAT of {avg_tat:.1f} days exceeds 30-day target. Consider staffing review."))
-        
-        # Volume insights
-        if total > 100:
-            insights.append(("📊 **High Volume Period**", 
-                           f"Processing {total} claims. Monitor capacity closely."))
-    
+        context = {
+            "total_claims": summary_data.get("total_claims", 0),
+            "approval_rate": summary_data.get("approval_rate", 0),
+            "avg_processing_time": avg_tat,
+            "tat_headroom": 25 - avg_tat
+        }
     else:  # policy insights
         total = summary_data.get("total_policies", 0)
-        lapse_rate = summary_data.get("lapse_rate", 0)
-        total_premium = summary_data.get("total_premium", 0)
-        
-        # Lapse rate insights
-        if lapse_rate < 5:
-            insights.append(("✨ **Strong Retention**", 
-                           f"Lapse rate of {lapse_rate:.1f}% indicates excellent policy retention"))
-        elif lapse_rate > 10:
-            insights.append(("⚠️ **Retention Risk**", 
-                           f"Lapse rate of {lapse_rate:.1f}% requires attention. Review customer satisfaction."))
-        
-        # Premium insights
-        avg_prem = total_premium / total if total > 0 else 0
-        if avg_prem > 4000:
-            insights.append(("💰 **Premium Portfolio**", 
-                           f"Average premium of ${avg_prem:,.0f} indicates high-value policies"))
+        context = {
+            "lapse_rate": summary_data.get("lapse_rate", 0),
+            "avg_premium_per_policy": summary_data.get("total_premium", 0) / total if total > 0 else 0
+        }
     
-    return insights
+    values = np.array([context[metric] for metric, _, _, _, _ in rules], dtype=np.float64)
+    fired = get_rule_evaluator()(values, ops, thresholds)
+    
+    return [
+        (title, message.format(**context))
+        for (_, _, _, title, message), hit in zip(rules, fired) if hit
+    ]
 
 # ============================================================================
 # Premium Dashboard Components
 # ============================================================================
 
+PREMIUM_HEADER_HTML = """
+<div class="main-header">
+    <h1 style='margin:0; font-size: 2.5rem;'>🏥 LTC Insurance Analytics</h1>
+    <p style='margin:0; font-size: 1.2rem; opacity: 0.9;'>Enterprise Intelligence Platform • Powered by Snowflake</p>
+</div>
+"""
+
+QUICK_STATS_ROW = Template("""
+<div style='display: flex; gap: 1rem;'>$cards</div>
+""")
+
+QUICK_STAT_CARD = Template(
+    "<div style='flex: 1; text-align: center; padding: 1rem; background: $background; border-radius: 10px; color: white;'>"
+    "<div style='font-size: 2rem; font-weight: bold;'>$value</div>"
+    "<div style='font-size: 0.9rem; opacity: 0.9;'>$label</div>"
+    "</div>"
+)
+
 def render_premium_header():
     """Render animated premium header."""
-    st.markdown("""
-    <div class="main-header">
-        <h1 style='margin:0; font-size: 2.5rem;'>🏥 LTC Insurance Analytics</h1>
-        <p style='margin:0; font-size: 1.2rem; opacity: 0.9;'>Enterprise Intelligence Platform • Powered by Snowflake</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(PREMIUM_HEADER_HTML, unsafe_allow_html=True)
 
 def render_quick_stats(metrics):
-    """Render quick stats bar at top."""
-    col1, col2, col3, col4 = st.columns(4)
-    
+    """Render quick stats bar at top as a single element."""
+    cards = (
+        ("linear-gradient(135deg, #667eea 0%, #764ba2 100%)", format_number(metrics.get('total', 0)), "Total Records"),
+        ("linear-gradient(135deg, #f093fb 0%, #f5576c 100%)", "⚡", "Real-time Data"),
+        ("linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)", f"{metrics.get('query_time', 0):.2f}s", "Query Time"),
+        ("linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)", "✓", "Cached"),
+    )
+    html = QUICK_STATS_ROW.substitute(cards="".join(
+        QUICK_STAT_CARD.substitute(background=background, value=value, label=label)
+        for background, value, label in cards
+    ))
+    st.markdown(html, unsafe_allow_html=True)
+
+def render_metric_table(rows):
+    """Render ``(metric, value)`` pairs as one table element instead of one st.metric each."""
+    st.dataframe(
+        pd.DataFrame(rows, columns=["Metric", "Value"]),
+        hide_index=True,
+        use_container_width=True
+    )
+
+SIDEBAR_FOOTER_HTML = """
+<div style='text-align: center; padding: 1rem; background-color: #f8f9fa; border-radius: 8px;'>
+    <div style='font-size: 0.8rem; color: #6c757d;'>
+        ⚡ Powered by <strong>Snowflake</strong><br/>
+        🚀 Built with <strong>Streamlit</strong><br/>
+        📊 v1.0.0 Premium Edition
+    </div>
+</div>
+"""
+
+@fragment
+def render_advanced_options():
+    """Render sidebar toggles; changing one reruns only this fragment, not the data pages."""
+    with st.expander("⚙️ Advanced Options"):
+        st.checkbox("📊 Comparison Mode", key="comparison_mode")
+        st.checkbox("🔄 Auto Refresh (5min)", key="auto_refresh")
+        st.checkbox("🤖 AI Insights", key="show_insights")
+
+DEFAULT_SNAPSHOT_DATE = date(2024, 10, 31)
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def get_preset_dates(today):
+    """Resolve the quick-preset snapshot dates once per calendar day.
+    
+    Every preset lands on a month end, so users picking the same preset share
+    identical SQL text and hit Snowflake's result cache.
+    """
+    month_start = today.replace(day=1)
+    return {
+        "Last Month": month_start - timedelta(days=1),
+        "Last Quarter": month_end(month_start - timedelta(days=90)),
+        "YTD": date(today.year - 1, 12, 31)
+    }
+
+@fragment
+def render_sidebar_actions():
+    """Render action buttons; Export reruns only this fragment, Refresh reruns the app."""
+    col1, col2 = st.columns(2)
     with col1:
-        st.markdown(f"""
-        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); border-radius: 10px; color: white;'>
-            <div style='font-size: 2rem; font-weight: bold;'>{format_number(metrics.get('total', 0))}</div>
-            <div style='font-size: 0.9rem; opacity: 0.9;'>Total Records</div>
-        </div>
-        """, unsafe_allow_html=True)
+        if st.button("🔄 Refresh", use_container_width=True):
+            st.cache_data.clear()
+            st.session_state.pop("page_data", None)
+            st.rerun()
     
     with col2:
-        st.markdown(f"""
-        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); border-radius: 10px; color: white;'>
-            <div style='font-size: 2rem; font-weight: bold;'>⚡</div>
-            <div style='font-size: 0.9rem; opacity: 0.9;'>Real-time Data</div>
-        </div>
-        """, unsafe_allow_html=True)
+        export_clicked = st.button("📥 Export", use_container_width=True)
     
-    with col3:
-        query_time = metrics.get('query_time', 0)
-        st.markdown(f"""
-        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); border-radius: 10px; color: white;'>
-            <div style='font-size: 2rem; font-weight: bold;'>{query_time:.2f}s</div>
-            <div style='font-size: 0.9rem; opacity: 0.9;'>Query Time</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div style='text-align: center; padding: 1rem; background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); border-radius: 10px; color: white;'>
-            <div style='font-size: 2rem; font-weight: bold;'>✓</div>
-            <div style='font-size: 0.9rem; opacity: 0.9;'>Cached</div>
-        </div>
-        """, unsafe_allow_html=True)
+    if export_clicked:
+        st.success("Export queued!")
 
 def render_sidebar():
     """Render premium sidebar."""
@@ -530,12 +721,7 @@ def render_sidebar():
         ["Custom", "Last Month", "Last Quarter", "YTD", "All Time"]
     )
     
-    if preset == "Last Month":
-        default_date = date.today().replace(day=1) - timedelta(days=1)
-    elif preset == "Last Quarter":
-        default_date = (date.today().replace(day=1) - timedelta(days=90))
-    else:
-        default_date = date(2024, 10, 31)
+    default_date = get_preset_dates(date.today()).get(preset, DEFAULT_SNAPSHOT_DATE)
     
     carrier_name = st.sidebar.selectbox(
         "🏢 Carrier",
@@ -552,38 +738,20 @@ def render_sidebar():
     
     st.sidebar.divider()
     
-    # Advanced options in expander
-    with st.sidebar.expander("⚙️ Advanced Options"):
-        st.session_state.comparison_mode = st.checkbox("📊 Comparison Mode", value=False)
-        auto_refresh = st.checkbox("🔄 Auto Refresh (5min)", value=False)
-        show_insights = st.checkbox("🤖 AI Insights", value=True)
+    # Advanced options rerun as a fragment; values are read from session state
+    with st.sidebar:
+        render_advanced_options()
     
     st.sidebar.divider()
     
-    # Action buttons
-    col1, col2 = st.sidebar.columns(2)
-    with col1:
-        if st.button("🔄 Refresh", use_container_width=True):
-            st.cache_data.clear()
-            st.rerun()
-    
-    with col2:
-        if st.button("📥 Export", use_container_width=True):
-            st.sidebar.success("Export queued!")
+    with st.sidebar:
+        render_sidebar_actions()
     
     # Footer
     st.sidebar.divider()
-    st.sidebar.markdown("""
-    <div style='text-align: center; padding: 1rem; background-color: #f8f9fa; border-radius: 8px;'>
-        <div style='font-size: 0.8rem; color: #6c757d;'>
-            ⚡ Powered by <strong>Snowflake</strong><br/>
-            🚀 Built with <strong>Streamlit</strong><br/>
-            📊 v1.0.0 Premium Edition
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.sidebar.markdown(SIDEBAR_FOOTER_HTML, unsafe_allow_html=True)
     
-    return page, carrier_filter, snapshot_date, st.session_state.get('comparison_mode', False), show_insights
+    return page, carrier_filter, snapshot_date, st.session_state.comparison_mode, st.session_state.show_insights
 
 # ============================================================================
 # Dashboard Pages (Continued in next message due to length)
@@ -598,15 +766,20 @@ def render_executive_summary(carrier_name, snapshot_date):
     
     with col1:
         with st.spinner("Loading executive summary..."):
-            claims_sum = get_claims_summary(session, carrier_name, snapshot_date)
-            policy_metrics = get_policy_metrics(session, carrier_name, snapshot_date)
+            start_time = time.perf_counter()
+            freshness = cache_freshness(snapshot_date)
+            claims_sum, policy_metrics = reuse_page_data(
+                "executive", (carrier_name, snapshot_date, freshness),
+                lambda: get_executive_kpis(carrier_name, snapshot_date, freshness)
+            )
+            query_time = time.perf_counter() - start_time
         
         st.success("✅ Data loaded successfully")
         
         # Combined metrics
         combined_metrics = {
             'total': claims_sum.get('total_claims', 0) + policy_metrics.get('total_policies', 0),
-            'query_time': (claims_sum.get('query_time', 0) + policy_metrics.get('query_time', 0)) / 2
+            'query_time': query_time
         }
         
         render_quick_stats(combined_metrics)
@@ -617,39 +790,31 @@ def render_executive_summary(carrier_name, snapshot_date):
         tab1, tab2, tab3 = st.tabs(["📋 Claims Overview", "📊 Policy Overview", "🎯 Combined Insights"])
         
         with tab1:
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Claims", format_number(claims_sum.get("total_claims", 0)))
-            with col2:
-                st.metric("Approval Rate", format_percentage(claims_sum.get("approval_rate", 0)))
-            with col3:
-                st.metric("Avg TAT", f"{claims_sum.get('avg_processing_time', 0):.1f} days")
-            with col4:
-                st.metric("Retro Claims", f"{claims_sum.get('retro_percentage', 0):.1f}%")
+            render_metric_table([
+                ("Total Claims", format_number(claims_sum.get("total_claims", 0))),
+                ("Approval Rate", format_percentage(claims_sum.get("approval_rate", 0))),
+                ("Avg TAT", f"{claims_sum.get('avg_processing_time', 0):.1f} days"),
+                ("Retro Claims", f"{claims_sum.get('retro_percentage', 0):.1f}%")
+            ])
         
         with tab2:
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Policies", format_number(policy_metrics.get("total_policies", 0)))
-            with col2:
-                st.metric("Active Rate", f"{100 - policy_metrics.get('lapse_rate', 0):.1f}%")
-            with col3:
-                st.metric("Total Premium", format_currency(policy_metrics.get("total_premium", 0), 0))
-            with col4:
-                st.metric("Avg Premium", format_currency(policy_metrics.get("avg_premium", 0)))
+            render_metric_table([
+                ("Total Policies", format_number(policy_metrics.get("total_policies", 0))),
+                ("Active Rate", f"{100 - policy_metrics.get('lapse_rate', 0):.1f}%"),
+                ("Total Premium", format_currency(policy_metrics.get("total_premium", 0), 0)),
+                ("Avg Premium", format_currency(policy_metrics.get("avg_premium", 0)))
+            ])
         
         with tab3:
             total_policies = policy_metrics.get("total_policies", 1)
             total_claims = claims_sum.get("total_claims", 0)
             claims_per_policy = (total_claims / total_policies) if total_policies > 0 else 0
             
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Claims per Policy", f"{claims_per_policy:.2f}")
-            with col2:
-                st.metric("Revenue at Risk", format_currency(policy_metrics.get("total_premium", 0) * 0.05, 0))
-            with col3:
-                st.metric("States Covered", format_number(policy_metrics.get("states_count", 0)))
+            render_metric_table([
+                ("Claims per Policy", f"{claims_per_policy:.2f}"),
+                ("Revenue at Risk", format_currency(policy_metrics.get("total_premium", 0) * 0.05, 0)),
+                ("States Covered", format_number(policy_metrics.get("states_count", 0)))
+            ])
     
     with col2:
         st.markdown("### 🤖 AI-Powered Insights")
@@ -676,18 +841,30 @@ def render_executive_summary(carrier_name, snapshot_date):
             </div>
             """, unsafe_allow_html=True)
 
+@fragment
 def render_claims_dashboard(carrier_name, report_end_dt):
     """Render comprehensive claims analytics dashboard with premium features."""
+    import plotly.graph_objects as go  # deferred: keeps plotly out of app cold start
+    
     st.header("📋 Claims Analytics Dashboard")
     
     with st.spinner("🔄 Loading claims data..."):
-        summary = get_claims_summary(session, carrier_name, report_end_dt)
-        claims_df = get_claims_list(session, carrier_name, report_end_dt, 100)
+        start_time = time.perf_counter()
+        freshness = cache_freshness(report_end_dt)
+        summary, claims_df = reuse_page_data(
+            "claims", (carrier_name, report_end_dt, freshness),
+            lambda: get_claims_overview(carrier_name, report_end_dt, 100, freshness)
+        )
+        query_time = time.perf_counter() - start_time
+    
+    if summary.get('total_claims', 0) == 0:
+        st.warning("⚠️ No claims data available for the selected filters.")
+        return
     
     st.success("✅ Data loaded successfully!")
     
     # Quick stats bar
-    render_quick_stats({'total': summary.get('total_claims', 0), 'query_time': summary.get('query_time', 0)})
+    render_quick_stats({'total': summary.get('total_claims', 0), 'query_time': query_time})
     
     st.divider()
     
@@ -790,62 +967,46 @@ def render_claims_dashboard(carrier_name, report_end_dt):
         
         with tab1:
             st.markdown("**Decision Breakdown**")
-            decision_data = pd.DataFrame({
-                "Decision": ["Approved", "Denied", "In Assessment"],
-                "Count": [
+            fig = go.Figure(go.Pie(
+                labels=["Approved", "Denied", "In Assessment"],
+                values=[
                     summary.get("approved_claims", 0),
                     summary.get("denied_claims", 0),
                     summary.get("in_assessment_claims", 0)
-                ]
-            })
-            fig = px.pie(
-                decision_data, 
-                values="Count", 
-                names="Decision",
-                color_discrete_sequence=["#00CC96", "#EF553B", "#FFA15A"],
-                hole=0.4
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
+                ],
+                marker_colors=["#00CC96", "#EF553B", "#FFA15A"],
+                hole=0.4,
+                textposition='inside',
+                textinfo='percent+label'
+            ))
             st.plotly_chart(fig, use_container_width=True)
         
         with tab2:
             st.markdown("**Category Breakdown**")
-            category_data = pd.DataFrame({
-                "Category": ["Facility", "Home Health", "Other"],
-                "Count": [
+            fig = go.Figure(go.Bar(
+                x=["Facility", "Home Health", "Other"],
+                y=[
                     summary.get("facility_claims", 0),
                     summary.get("home_health_claims", 0),
                     summary.get("other_claims", 0)
-                ]
-            })
-            fig = px.bar(
-                category_data, 
-                x="Category", 
-                y="Count",
-                color="Category",
-                color_discrete_sequence=["#636EFA", "#AB63FA", "#FFA15A"]
-            )
+                ],
+                marker_color=["#636EFA", "#AB63FA", "#FFA15A"]
+            ))
             fig.update_layout(showlegend=False, xaxis_title="Category", yaxis_title="Number of Claims")
             st.plotly_chart(fig, use_container_width=True)
         
         with tab3:
             st.markdown("**Ongoing Rate Month Distribution**")
-            ongoing_data = pd.DataFrame({
-                "Type": ["Initial", "Ongoing", "Restoration"],
-                "Count": [
+            fig = go.Figure(go.Bar(
+                x=["Initial", "Ongoing", "Restoration"],
+                y=[
                     summary.get("initial_decisions", 0),
                     summary.get("ongoing_decisions", 0),
                     summary.get("restoration_decisions", 0)
-                ]
-            })
-            fig = px.bar(
-                ongoing_data, 
-                x="Type", 
-                y="Count",
-                color="Type",
-                color_discrete_sequence=["#00CC96", "#636EFA", "#EF553B"]
-            )
-            fig.update_layout(showlegend=False)
+                ],
+                marker_color=["#00CC96", "#636EFA", "#EF553B"]
+            ))
+            fig.update_layout(showlegend=False, xaxis_title="Type", yaxis_title="Count")
             st.plotly_chart(fig, use_container_width=True)
     
     st.divider()
@@ -857,16 +1018,16 @@ def render_claims_dashboard(carrier_name, report_end_dt):
     with col_left2:
         retro_total = summary.get("total_retro_claims", 0)
         if retro_total > 0:
-            retro_data = pd.DataFrame({
-                "Category": ["Facility", "Home Health", "Other"],
-                "Count": [
-                    summary.get("facility_claims", 0) * 0.15,
-                    summary.get("home_health_claims", 0) * 0.1,
-                    summary.get("other_claims", 0) * 0.05
-                ]
-            })
-            fig = px.bar(retro_data, x="Category", y="Count", color_discrete_sequence=["#FF6692"])
-            fig.update_layout(title="Estimated Retro Claims by Category")
+            fig = go.Figure(go.Bar(
+                x=["Facility", "Home Health", "Other"],
+                y=[
+                    summary.get("retro_facility_claims", 0),
+                    summary.get("retro_home_health_claims", 0),
+                    summary.get("retro_other_claims", 0)
+                ],
+                marker_color="#FF6692"
+            ))
+            fig.update_layout(title="Retro Claims by Category", xaxis_title="Category", yaxis_title="Count")
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No retroactive claims in this period")
@@ -893,44 +1054,47 @@ def render_claims_dashboard(carrier_name, report_end_dt):
     st.subheader("📋 Recent Claims")
     st.markdown(f"*Showing {len(claims_df)} most recent claims*")
     
-    if not claims_df.empty:
-        # Format the dataframe
-        display_df = claims_df.copy()
-        if 'TAT_Days' in display_df.columns:
-            display_df['TAT_Days'] = display_df['TAT_Days'].apply(lambda x: f"{x:.0f}" if pd.notna(x) else "N/A")
-        
-        st.dataframe(display_df, height=400)
-        
-        # Download section
-        col_dl1, col_dl2, col_dl3 = st.columns([2, 1, 1])
-        with col_dl1:
-            csv = claims_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Claims Data (CSV)",
-                data=csv,
-                file_name=f"claims_export_{report_end_dt}.csv",
-                mime="text/csv"
-            )
-        with col_dl2:
-            st.metric("Records", len(claims_df))
-        with col_dl3:
-            st.metric("Columns", len(claims_df.columns))
-    else:
-        st.warning("⚠️ No claims data available for the selected filters.")
+    st.dataframe(claims_df.style.format({"TAT_Days": "{:.0f}"}, na_rep="N/A"), height=400)
+    
+    # Download section
+    col_dl1, col_dl2, col_dl3 = st.columns([2, 1, 1])
+    with col_dl1:
+        st.download_button(
+            label="📥 Download Claims Data (CSV)",
+            data=get_claims_csv(carrier_name, report_end_dt, 100, freshness),
+            file_name=f"claims_export_{report_end_dt}.csv",
+            mime="text/csv"
+        )
+    with col_dl2:
+        st.metric("Records", len(claims_df))
+    with col_dl3:
+        st.metric("Columns", len(claims_df.columns))
 
+@fragment
 def render_policy_dashboard(carrier_name, snapshot_date):
     """Render comprehensive policy analytics dashboard with premium features."""
+    import plotly.express as px  # deferred: keeps plotly out of app cold start
+    import plotly.graph_objects as go
+    
     st.header("📊 Policy Analytics Dashboard")
     
     with st.spinner("🔄 Loading policy data..."):
-        metrics = get_policy_metrics(session, carrier_name, snapshot_date)
-        state_dist = get_state_distribution(session, carrier_name, snapshot_date, 10)
-        policy_df = get_policy_list(session, carrier_name, snapshot_date, 100)
+        start_time = time.perf_counter()
+        freshness = cache_freshness(snapshot_date)
+        metrics, states_by_count, states_by_premium, policy_df = reuse_page_data(
+            "policy", (carrier_name, snapshot_date, freshness),
+            lambda: get_policy_overview(carrier_name, snapshot_date, 10, 100, freshness)
+        )
+        query_time = time.perf_counter() - start_time
+    
+    if metrics.get('total_policies', 0) == 0:
+        st.warning("⚠️ No policy data available for the selected filters.")
+        return
     
     st.success("✅ Data loaded successfully!")
     
     # Quick stats bar
-    render_quick_stats({'total': metrics.get('total_policies', 0), 'query_time': metrics.get('query_time', 0)})
+    render_quick_stats({'total': metrics.get('total_policies', 0), 'query_time': query_time})
     
     st.divider()
     
@@ -1081,41 +1245,28 @@ def render_policy_dashboard(carrier_name, snapshot_date):
         
         with tab1:
             st.markdown("**Active vs Lapsed Policies**")
-            status_data = pd.DataFrame({
-                "Status": ["Active", "Lapsed"],
-                "Count": [
-                    active_policies,
-                    total_policies - active_policies
-                ]
-            })
-            fig = px.pie(
-                status_data, 
-                values="Count", 
-                names="Status",
-                color_discrete_sequence=["#00CC96", "#EF553B"],
-                hole=0.4
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
+            fig = go.Figure(go.Pie(
+                labels=["Active", "Lapsed"],
+                values=[active_policies, total_policies - active_policies],
+                marker_colors=["#00CC96", "#EF553B"],
+                hole=0.4,
+                textposition='inside',
+                textinfo='percent+label'
+            ))
             st.plotly_chart(fig, use_container_width=True)
         
         with tab2:
             st.markdown("**Waiver Status Breakdown**")
-            waiver_data = pd.DataFrame({
-                "Status": ["In Waiver", "In Forfeiture", "Standard"],
-                "Count": [
+            fig = go.Figure(go.Bar(
+                x=["In Waiver", "In Forfeiture", "Standard"],
+                y=[
                     metrics.get("in_waiver", 0),
                     metrics.get("in_forfeiture", 0),
                     total_policies - metrics.get("in_waiver", 0) - metrics.get("in_forfeiture", 0)
-                ]
-            })
-            fig = px.bar(
-                waiver_data, 
-                x="Status", 
-                y="Count",
-                color="Status",
-                color_discrete_sequence=["#636EFA", "#AB63FA", "#00CC96"]
-            )
-            fig.update_layout(showlegend=False)
+                ],
+                marker_color=["#636EFA", "#AB63FA", "#00CC96"]
+            ))
+            fig.update_layout(showlegend=False, xaxis_title="Status", yaxis_title="Count")
             st.plotly_chart(fig, use_container_width=True)
         
         with tab3:
@@ -1136,13 +1287,13 @@ def render_policy_dashboard(carrier_name, snapshot_date):
     # Geographic Analysis
     st.subheader("🗺️ Geographic Analysis")
     
-    if not state_dist.empty:
+    if not states_by_count.empty:
         col_left2, col_right2 = st.columns(2)
         
         with col_left2:
             st.markdown("**Top 10 States by Policy Count**")
             fig = px.bar(
-                state_dist.head(10), 
+                states_by_count, 
                 x="INSURED_STATE", 
                 y="POLICY_COUNT",
                 color="POLICY_COUNT",
@@ -1157,9 +1308,8 @@ def render_policy_dashboard(carrier_name, snapshot_date):
         
         with col_right2:
             st.markdown("**Premium Revenue by State**")
-            state_dist_sorted = state_dist.sort_values("TOTAL_PREMIUM", ascending=True).tail(10)
             fig = px.bar(
-                state_dist_sorted, 
+                states_by_premium, 
                 x="TOTAL_PREMIUM", 
                 y="INSURED_STATE",
                 orientation='h',
@@ -1181,32 +1331,21 @@ def render_policy_dashboard(carrier_name, snapshot_date):
     st.subheader("📋 Recent Policies")
     st.markdown(f"*Showing {len(policy_df)} most recent policies*")
     
-    if not policy_df.empty:
-        # Format the dataframe
-        display_df = policy_df.copy()
-        if 'Annual_Premium' in display_df.columns:
-            display_df['Annual_Premium'] = display_df['Annual_Premium'].apply(
-                lambda x: format_currency(float(x)) if pd.notna(x) else "N/A"
-            )
-        
-        st.dataframe(display_df, height=400)
-        
-        # Download section
-        col_dl1, col_dl2, col_dl3 = st.columns([2, 1, 1])
-        with col_dl1:
-            csv = policy_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Policy Data (CSV)",
-                data=csv,
-                file_name=f"policy_export_{snapshot_date}.csv",
-                mime="text/csv"
-            )
-        with col_dl2:
-            st.metric("Records", len(policy_df))
-        with col_dl3:
-            st.metric("Columns", len(policy_df.columns))
-    else:
-        st.warning("⚠️ No policy data available for the selected filters.")
+    st.dataframe(policy_df.style.format({"Annual_Premium": "${:,.2f}"}, na_rep="N/A"), height=400)
+    
+    # Download section
+    col_dl1, col_dl2, col_dl3 = st.columns([2, 1, 1])
+    with col_dl1:
+        st.download_button(
+            label="📥 Download Policy Data (CSV)",
+            data=get_policy_csv(carrier_name, snapshot_date, 10, 100, freshness),
+            file_name=f"policy_export_{snapshot_date}.csv",
+            mime="text/csv"
+        )
+    with col_dl2:
+        st.metric("Records", len(policy_df))
+    with col_dl3:
+        st.metric("Columns", len(policy_df.columns))
 
 def main():
     """Main application."""
@@ -1216,7 +1355,8 @@ def main():
     if page == "🏠 Executive Summary":
         render_executive_summary(carrier_filter, snapshot_date)
     elif page == "📋 Claims Analytics":
-        render_claims_dashboard(carrier_filter, snapshot_date)
+        # Claims are monthly: key the cache on month end so any day in the month hits
+        render_claims_dashboard(carrier_filter, month_end(snapshot_date))
     elif page == "📊 Policy Analytics":
         render_policy_dashboard(carrier_filter, snapshot_date)
     else: